@@ -0,0 +1,61 @@
+"""
+Shared cross-worker cache backend for the AI microservice.
+
+In-process caches evaporate on cold starts and are private to each worker.
+When CACHE_REDIS_URL (or REDIS_URL) is set and redis is installed, this
+module gives every worker one shared tier keyed by opaque strings and
+holding opaque bytes; without it, get() misses and set() is a no-op, so
+callers keep their in-process behaviour unchanged. Backend errors degrade
+the same way — a shared-cache problem must never fail the request.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import Optional
+
+try:  # Optional shared cache backend; in-process caches are the fallback.
+    import redis.asyncio as redis_asyncio
+
+    _HAS_REDIS = True
+except ImportError:  # pragma: no cover - depends on environment
+    _HAS_REDIS = False
+
+logger = logging.getLogger(__name__)
+
+CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL") or os.getenv("REDIS_URL")
+
+_redis_client: Optional["redis_asyncio.Redis"] = None
+
+
+def _get_redis() -> Optional["redis_asyncio.Redis"]:
+    global _redis_client
+    if not (_HAS_REDIS and CACHE_REDIS_URL):
+        return None
+    if _redis_client is None:
+        _redis_client = redis_asyncio.from_url(CACHE_REDIS_URL)
+    return _redis_client
+
+
+async def get(key: str) -> Optional[bytes]:
+    """Fetch a value from the shared cache; None on miss or backend trouble."""
+    client = _get_redis()
+    if client is None:
+        return None
+    try:
+        return await client.get(key)
+    except Exception as exc:
+        logger.warning("Shared cache read failed: %s", exc)
+        return None
+
+
+async def set(key: str, value: bytes, ttl_seconds: int) -> None:
+    """Store a value with a TTL; failures are logged and swallowed."""
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        await client.setex(key, ttl_seconds, value)
+    except Exception as exc:
+        logger.warning("Shared cache write failed: %s", exc)
@@ -14,8 +14,11 @@ import asyncio
 import hashlib
 import logging
 import os
+import random
+import re
+import threading
 import time
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Optional, Sequence
 
@@ -25,12 +28,13 @@ from openai import (
     APIError,
     APITimeoutError,
     BadRequestError,
-    OpenAI,
     OpenAIError,
     RateLimitError,
 )
 from dotenv import load_dotenv
 
+from app.openai_client import async_client
+
 # Load environment variables before accessing them
 load_dotenv()
 
@@ -39,15 +43,14 @@ logger = logging.getLogger(__name__)
 EMBEDDING_MODEL = "text-embedding-3-large"
 EMBEDDING_DIMENSION = 3072  # Dimension for text-embedding-3-large
 MAX_BATCH_SIZE = int(os.getenv("EMBEDDING_MAX_BATCH", "32"))
+MAX_INFLIGHT_BATCHES = int(os.getenv("EMBEDDING_MAX_INFLIGHT_BATCHES", "4"))
 CACHE_TTL_SECONDS = int(os.getenv("EMBEDDING_CACHE_TTL_SECONDS", str(15 * 60)))
 CACHE_MAX_ENTRIES = int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "512"))
 MAX_INPUT_CHAR_LENGTH = int(os.getenv("EMBEDDING_MAX_INPUT_CHARS", "16000"))
 
-_api_key = os.getenv("OPENAI_API_KEY")
-if not _api_key:
-    raise RuntimeError("OPENAI_API_KEY environment variable is required for embeddings")
-
-_client = OpenAI(api_key=_api_key)
+# Module-level alias so tests (and callers) can swap the client per module
+# without touching the shared instance in app.openai_client.
+_client = async_client
 
 
 class EmbeddingError(RuntimeError):
@@ -56,12 +59,27 @@ class EmbeddingError(RuntimeError):
 
 @dataclass
 class _CacheEntry:
-    value: List[float]
+    value: np.ndarray
     expires_at: float
 
 
 _cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
-_cache_lock = asyncio.Lock()
+# Insertion-ordered (expires_at, key) pairs; since the TTL is constant the
+# deque head is always the oldest entry, letting writers evict expired
+# entries first before falling back to LRU capacity eviction.
+_expiry_index: "deque[tuple[float, str]]" = deque()
+# Individual OrderedDict operations are atomic under the GIL, so reads go
+# lock-free; this lock only serialises writers during insert + eviction.
+_cache_write_lock = threading.Lock()
+
+# In-flight OpenAI requests keyed by cache key, so concurrent callers asking
+# for the same text coalesce onto a single network request.
+_pending: Dict[str, "asyncio.Future[np.ndarray]"] = {}
+
+
+# Matches anything the normalisation below would change: leading/trailing
+# whitespace, runs of whitespace, or whitespace other than a plain space.
+_NEEDS_NORMALISATION_RE = re.compile(r"^\s|\s$|\s\s|[^\S ]")
 
 
 def _normalise_text(text: str) -> str:
@@ -71,56 +89,62 @@ def _normalise_text(text: str) -> str:
       * collapse internal whitespace to single spaces
       * ensure newline consistency
     """
+    if not _NEEDS_NORMALISATION_RE.search(text):
+        # Already clean — skip the intermediate string allocations.
+        return text
     collapsed = " ".join(text.replace("\r\n", "\n").replace("\r", "\n").split())
     return collapsed.strip()
 
 
 def _hash_text(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    # blake2b is roughly twice as fast as sha256 per call, and a 128-bit
+    # digest is ample for collision resistance in a cache this size.
+    return hashlib.blake2b(
+        text.encode("utf-8"), digest_size=16, person=b"emb-cache"
+    ).hexdigest()
 
 
-async def _get_from_cache(key: str) -> Optional[List[float]]:
-    async with _cache_lock:
-        entry = _cache.get(key)
-        now = time.monotonic()
-        if not entry:
-            return None
+def _get_from_cache(key: str) -> Optional[np.ndarray]:
+    entry = _cache.get(key)
+    if not entry:
+        return None
 
-        if entry.expires_at < now:
-            _cache.pop(key, None)
-            return None
+    if entry.expires_at < time.monotonic():
+        _cache.pop(key, None)
+        return None
 
+    try:
         _cache.move_to_end(key)
-        return entry.value
+    except KeyError:
+        # Entry was evicted between the lookup and the LRU bump.
+        return None
+    return entry.value
 
 
-async def _set_cache(key: str, value: List[float]) -> None:
-    async with _cache_lock:
+def _set_cache(key: str, value: np.ndarray) -> None:
+    now = time.monotonic()
+    expires_at = now + CACHE_TTL_SECONDS
+    with _cache_write_lock:
         if key in _cache:
             _cache.move_to_end(key)
-        _cache[key] = _CacheEntry(
-            value=value, expires_at=time.monotonic() + CACHE_TTL_SECONDS
-        )
+        _cache[key] = _CacheEntry(value=value, expires_at=expires_at)
+        _expiry_index.append((expires_at, key))
+
+        # Reclaim TTL-expired entries first so they do not occupy capacity
+        # and push live entries out prematurely.
+        while _expiry_index and _expiry_index[0][0] < now:
+            _, stale_key = _expiry_index.popleft()
+            stale_entry = _cache.get(stale_key)
+            if stale_entry is not None and stale_entry.expires_at < now:
+                _cache.pop(stale_key, None)
 
         while len(_cache) > CACHE_MAX_ENTRIES:
             _cache.popitem(last=False)
 
 
-def _optimise_embedding_storage(embedding: Sequence[float]) -> List[float]:
-    """
-    Convert embedding to float32 to halve storage requirements while keeping precision.
-    """
-    array = np.asarray(embedding, dtype=np.float32)
-    return array.tolist()
-
-
-def _validate_embedding_dimensions(embedding: Sequence[float]) -> None:
-    length = len(embedding)
-    if length != EMBEDDING_DIMENSION:
-        raise EmbeddingError(
-            f"Embedding dimension mismatch: expected {EMBEDDING_DIMENSION}, "
-            f"got {length}"
-        )
+def embedding_to_list(array: np.ndarray) -> List[float]:
+    """Materialise a stored embedding as Python floats at the API boundary."""
+    return array.astype(np.float32).tolist()
 
 
 def _prepare_text(text: str) -> str:
@@ -130,6 +154,13 @@ def _prepare_text(text: str) -> str:
     if not text.strip():
         raise EmbeddingError("Text cannot be empty")
 
+    # Cheap guard before normalisation allocates intermediate copies of the
+    # input; the 2x headroom allows for whitespace collapse.
+    if len(text) > MAX_INPUT_CHAR_LENGTH * 2:
+        raise EmbeddingError(
+            f"Text exceeds maximum allowed length of {MAX_INPUT_CHAR_LENGTH} characters"
+        )
+
     normalised = _normalise_text(text)
     if len(normalised) == 0:
         raise EmbeddingError("Text cannot be empty after preprocessing")
@@ -142,10 +173,9 @@ def _prepare_text(text: str) -> str:
     return normalised
 
 
-async def _fetch_embeddings_from_openai(texts: Sequence[str]) -> List[List[float]]:
+async def _fetch_embeddings_from_openai(texts: Sequence[str]) -> List[np.ndarray]:
     try:
-        response = await asyncio.to_thread(
-            _client.embeddings.create,
+        response = await _client.embeddings.create(
             model=EMBEDDING_MODEL,
             input=list(texts),
         )
@@ -157,13 +187,23 @@ async def _fetch_embeddings_from_openai(texts: Sequence[str]) -> List[List[float
                 f"got {len(data)}"
             )
 
-        embeddings: List[List[float]] = []
-        for item in data:
-            embedding = item.embedding
-            _validate_embedding_dimensions(embedding)
-            embeddings.append(_optimise_embedding_storage(embedding))
+        # Convert and validate the whole batch at once: a single float16 cast
+        # (half the RAM of float32, negligible recall impact) plus one shape
+        # check instead of per-item Python validation.
+        try:
+            array = np.asarray([item.embedding for item in data], dtype=np.float16)
+        except ValueError as exc:
+            raise EmbeddingError(
+                "OpenAI response contained embeddings of inconsistent dimensions"
+            ) from exc
+
+        if array.ndim != 2 or array.shape[1] != EMBEDDING_DIMENSION:
+            raise EmbeddingError(
+                f"Embedding dimension mismatch: expected {EMBEDDING_DIMENSION}, "
+                f"got {array.shape[1] if array.ndim == 2 else array.ndim}"
+            )
 
-        return embeddings
+        return list(array)
 
     except RateLimitError as exc:
         logger.warning("OpenAI embedding request throttled: %s", exc)
@@ -238,37 +278,104 @@ def _chunked(iterable: Sequence[str], size: int) -> Iterable[Sequence[str]]:
         yield iterable[index : index + size]
 
 
-async def generate_embeddings_batch(texts: Sequence[str]) -> List[List[float]]:
+async def generate_embeddings_batch(texts: Sequence[str]) -> List[np.ndarray]:
     """
     Generate embeddings for a batch of texts while leveraging caching to minimise
     duplicate OpenAI calls.
+
+    Returns float16 ndarrays; callers serialising to JSON should go through
+    :func:`embedding_to_list` at the boundary.
     """
     if not texts:
         return []
 
     prepared_texts = [_prepare_text(text) for text in texts]
-    results: List[Optional[List[float]]] = [None] * len(prepared_texts)
+    results: List[Optional[np.ndarray]] = [None] * len(prepared_texts)
     pending_map: Dict[str, List[int]] = {}
+    borrowed: Dict[str, "asyncio.Future[np.ndarray]"] = {}
+    owned_futures: Dict[str, "asyncio.Future[np.ndarray]"] = {}
+    loop = asyncio.get_running_loop()
 
-    # Attempt to hydrate from cache
+    # Deduplicate up front so repeated texts cost one hash, one cache lookup,
+    # and at most one network slot regardless of how often they appear.
+    unique_to_indices: Dict[str, List[int]] = {}
     for idx, text in enumerate(prepared_texts):
-        cache_key = _hash_text(text)
-        cached_embedding = await _get_from_cache(cache_key)
+        unique_to_indices.setdefault(text, []).append(idx)
+
+    # Hash each unique text once; the key is reused for cache lookups,
+    # request coalescing, and post-fetch cache writes.
+    key_by_text: Dict[str, str] = {}
+
+    # Attempt to hydrate from cache, coalescing misses onto in-flight requests
+    for text, indices in unique_to_indices.items():
+        cache_key = key_by_text.setdefault(text, _hash_text(text))
+        cached_embedding = _get_from_cache(cache_key)
         if cached_embedding is not None:
-            results[idx] = cached_embedding
+            for idx in indices:
+                results[idx] = cached_embedding
             continue
-        pending_map.setdefault(text, []).append(idx)
 
-    if pending_map:
-        pending_texts = list(pending_map.keys())
-        for chunk in _chunked(pending_texts, MAX_BATCH_SIZE):
-            embeddings = await _fetch_embeddings_from_openai(chunk)
+        with _cache_write_lock:
+            existing = _pending.get(cache_key)
+            if existing is None:
+                _pending[cache_key] = owned_futures.setdefault(
+                    text, loop.create_future()
+                )
+        if existing is not None:
+            borrowed[text] = existing
+        pending_map[text] = indices
+
+    fetch_texts = [text for text in pending_map if text in owned_futures]
+    if fetch_texts:
+        pending_texts = fetch_texts
+        chunks = list(_chunked(pending_texts, MAX_BATCH_SIZE))
+        semaphore = asyncio.Semaphore(max(1, MAX_INFLIGHT_BATCHES))
+
+        async def _fetch_chunk(
+            position: int, chunk: Sequence[str]
+        ) -> List[np.ndarray]:
+            async with semaphore:
+                # Stagger follow-up batches slightly so a burst of chunks does
+                # not hit the API in lock-step and trip rate limiting.
+                if position:
+                    await asyncio.sleep(random.uniform(0.0, 0.05))
+                return await _fetch_embeddings_from_openai(chunk)
+
+        try:
+            chunk_results = await asyncio.gather(
+                *(
+                    _fetch_chunk(position, chunk)
+                    for position, chunk in enumerate(chunks)
+                )
+            )
+        except Exception as exc:
+            with _cache_write_lock:
+                for text_value, future in owned_futures.items():
+                    _pending.pop(key_by_text[text_value], None)
+                    if not future.done():
+                        future.set_exception(exc)
+                        # Suppress "exception never retrieved" warnings when no
+                        # other caller is waiting on this future.
+                        future.exception()
+            raise
+
+        for chunk, embeddings in zip(chunks, chunk_results):
             for text_value, embedding in zip(chunk, embeddings):
-                cache_key = _hash_text(text_value)
-                await _set_cache(cache_key, embedding)
+                cache_key = key_by_text[text_value]
+                _set_cache(cache_key, embedding)
+                with _cache_write_lock:
+                    _pending.pop(cache_key, None)
+                future = owned_futures[text_value]
+                if not future.done():
+                    future.set_result(embedding)
                 for original_index in pending_map[text_value]:
                     results[original_index] = embedding
 
+    for text_value, future in borrowed.items():
+        embedding = await future
+        for original_index in pending_map[text_value]:
+            results[original_index] = embedding
+
     # All slots should now be filled; if not, raise an error
     if any(embedding is None for embedding in results):
         raise EmbeddingError("Failed to resolve embeddings for all texts")
@@ -276,9 +383,43 @@ async def generate_embeddings_batch(texts: Sequence[str]) -> List[List[float]]:
     return [embedding for embedding in results if embedding is not None]
 
 
-async def generate_embedding(text: str) -> List[float]:
+async def generate_embedding(text: str) -> np.ndarray:
     """
-    Convenience wrapper around batch generation for a single text.
+    Fast path for a single text: cache lookup, one API call, cache write.
+
+    Skips the batch pipeline's pending-map/chunking allocations while still
+    coalescing with any in-flight request for the same text.
     """
-    embeddings = await generate_embeddings_batch([text])
-    return embeddings[0]
+    prepared = _prepare_text(text)
+    key = _hash_text(prepared)
+    cached = _get_from_cache(key)
+    if cached is not None:
+        return cached
+
+    loop = asyncio.get_running_loop()
+    with _cache_write_lock:
+        existing = _pending.get(key)
+        if existing is None:
+            future: "asyncio.Future[np.ndarray]" = loop.create_future()
+            _pending[key] = future
+    if existing is not None:
+        return await existing
+
+    try:
+        embedding = (await _fetch_embeddings_from_openai([prepared]))[0]
+    except Exception as exc:
+        with _cache_write_lock:
+            _pending.pop(key, None)
+        if not future.done():
+            future.set_exception(exc)
+            # Suppress "exception never retrieved" warnings when no other
+            # caller is waiting on this future.
+            future.exception()
+        raise
+
+    _set_cache(key, embedding)
+    with _cache_write_lock:
+        _pending.pop(key, None)
+    if not future.done():
+        future.set_result(embedding)
+    return embedding
@@ -10,45 +10,38 @@ Responsibilities:
 
 from __future__ import annotations
 
-import asyncio
-import json
 import logging
 import os
 import re
-from typing import Any, Dict, Final, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Final, Mapping, Optional
+
+import orjson
 
 from openai import (
     APIConnectionError,
     APIError,
     APITimeoutError,
     BadRequestError,
-    OpenAI,
     OpenAIError,
     RateLimitError,
 )
 from dotenv import load_dotenv
 
 from app.models import GraduateProfile, JobRequirements
+from app.openai_client import async_client as client
 
 # Load environment variables before accessing them
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
-_api_key = os.getenv("OPENAI_API_KEY")
-if not _api_key:
-    raise RuntimeError(
-        "OPENAI_API_KEY environment variable is required for feedback generation"
-    )
-
-client = OpenAI(api_key=_api_key)
-
 FEEDBACK_MODEL: Final[str] = os.getenv("FEEDBACK_MODEL", "gpt-4o-mini")
 FEEDBACK_TEMPERATURE: Final[float] = float(os.getenv("FEEDBACK_TEMPERATURE", "0.4"))
 FEEDBACK_MAX_TOKENS: Final[int] = int(os.getenv("FEEDBACK_MAX_TOKENS", "900"))
 
 DEFAULT_LANGUAGE: Final[str] = os.getenv("FEEDBACK_DEFAULT_LANGUAGE", "en")
-DEFAULT_TEMPLATE: Dict[str, str] = {
+DEFAULT_TEMPLATE: Mapping[str, str] = MappingProxyType({
     "introduction": (
         "Offer encouragement and summarise the graduate's current readiness."
     ),
@@ -63,17 +56,23 @@ DEFAULT_TEMPLATE: Dict[str, str] = {
     "formatting": (
         "Respond with concise paragraphs and bullet lists where appropriate."
     ),
-}
+})
 
 
 class FeedbackGenerationError(RuntimeError):
     """Raised when feedback generation fails."""
 
 
-def _merge_templates(overrides: Optional[Dict[str, str]]) -> Dict[str, str]:
+_FENCE_RE: Final = re.compile(
+    r"```(?:json)?\s*(.+?)\s*```", re.IGNORECASE | re.DOTALL
+)
+
+
+def _merge_templates(overrides: Optional[Dict[str, str]]) -> Mapping[str, str]:
     if not overrides:
-        return DEFAULT_TEMPLATE.copy()
-    merged = DEFAULT_TEMPLATE.copy()
+        # Read-only default; skip the copy on the common no-override path.
+        return DEFAULT_TEMPLATE
+    merged = dict(DEFAULT_TEMPLATE)
     for key, value in overrides.items():
         if isinstance(value, str) and value.strip():
             merged[key] = value.strip()
@@ -93,53 +92,79 @@ def _serialise_list(values: Optional[Any]) -> str:
     return str(values)
 
 
-def _build_prompt(
-    graduate_profile: GraduateProfile,
-    job_requirements: JobRequirements,
-    language: str,
-    additional_context: Optional[str],
-    template: Dict[str, str],
-) -> str:
-    context_block = (
-        f"\nAdditional Context:\n{additional_context.strip()}\n"
-        if additional_context and additional_context.strip()
-        else ""
-    )  # noqa: E501
-    prompt = f"""
-You are an expert career counsellor who communicates in {language.upper()}.
+# Built once at import; _build_prompt only substitutes the dynamic fields
+# instead of re-assembling the full ~1 KB prompt per request.
+_PROMPT_TEMPLATE: Final[str] = """
+You are an expert career counsellor who communicates in {language}.
 Compare the graduate's background with the job requirements and produce an honest yet constructive review.
 
 Graduate Profile:
-- Skills: {_serialise_list(graduate_profile.skills)}
-- Education: {graduate_profile.education.strip() if graduate_profile.education else 'Not specified'}
-- Experience: {(graduate_profile.experience or 'Not specified').strip()}
+- Skills: {graduate_skills}
+- Education: {graduate_education}
+- Experience: {graduate_experience}
 
 Job Requirements:
-- Required Skills: {_serialise_list(job_requirements.skills)}
-- Education: {(job_requirements.education or 'Not specified').strip()}
-- Experience: {(job_requirements.experience or 'Not specified').strip()}
+- Required Skills: {job_skills}
+- Education: {job_education}
+- Experience: {job_experience}
 {context_block}
 
 Follow these guidelines:
-- Introduction: {template['introduction']}
-- Skill Gaps: {template['skill_gaps']}
-- Recommendations: {template['recommendations']}
-- Formatting: {template['formatting']}  # noqa: E501
+- Introduction: {introduction}
+- Skill Gaps: {skill_gaps}
+- Recommendations: {recommendations}
+- Formatting: {formatting}
 
 Respond **only** with valid JSON using this schema:
 {{
-  "feedback": "A concise narrative (max 3 paragraphs) written in {language.upper()}",
-  "skill_gaps": ["Skill gap summary in {language.upper()} (sentence case)", "..."],
-  "recommendations": ["Actionable recommendation in {language.upper()} (sentence case)", "..."]
+  "feedback": "A concise narrative (max 3 paragraphs) written in {language}",
+  "skill_gaps": ["Skill gap summary in {language} (sentence case)", "..."],
+  "recommendations": ["Actionable recommendation in {language} (sentence case)", "..."]
 }}
 
 Ensure that each list contains between 2 and 5 items. Do not include Markdown code fences or extra commentary.
-"""
-    return prompt.strip()
+""".strip()
+
+
+def _build_prompt(
+    graduate_profile: GraduateProfile,
+    job_requirements: JobRequirements,
+    language: str,
+    additional_context: Optional[str],
+    template: Mapping[str, str],
+) -> str:
+    context_block = (
+        f"\nAdditional Context:\n{additional_context.strip()}\n"
+        if additional_context and additional_context.strip()
+        else ""
+    )
+    language_upper = language.upper()
+    return _PROMPT_TEMPLATE.format_map(
+        {
+            "language": language_upper,
+            "graduate_skills": _serialise_list(graduate_profile.skills),
+            "graduate_education": (
+                graduate_profile.education.strip()
+                if graduate_profile.education
+                else "Not specified"
+            ),
+            "graduate_experience": (
+                graduate_profile.experience or "Not specified"
+            ).strip(),
+            "job_skills": _serialise_list(job_requirements.skills),
+            "job_education": (job_requirements.education or "Not specified").strip(),
+            "job_experience": (job_requirements.experience or "Not specified").strip(),
+            "context_block": context_block,
+            "introduction": template["introduction"],
+            "skill_gaps": template["skill_gaps"],
+            "recommendations": template["recommendations"],
+            "formatting": template["formatting"],
+        }
+    )
 
 
 def _extract_json_block(text: str) -> str:
-    fenced = re.search(r"```(?:json)?\s*(.+?)\s*```", text, re.IGNORECASE | re.DOTALL)
+    fenced = _FENCE_RE.search(text)
     if fenced:
         return fenced.group(1)
     return text.strip()
@@ -148,8 +173,8 @@ def _extract_json_block(text: str) -> str:
 def _parse_response(content: str, language: str) -> Dict[str, Any]:
     cleaned = _extract_json_block(content)
     try:
-        parsed = json.loads(cleaned)
-    except json.JSONDecodeError as exc:
+        parsed = orjson.loads(cleaned)
+    except orjson.JSONDecodeError as exc:
         logger.error("Unable to parse feedback JSON: %s", exc)
         raise FeedbackGenerationError(
             "Feedback generation returned invalid JSON"
@@ -163,14 +188,13 @@ def _parse_response(content: str, language: str) -> Dict[str, Any]:
         values = parsed.get(key)
         if not isinstance(values, list):
             return []
-        result: list[str] = []
-        for item in values:
-            if not isinstance(item, str):
-                continue
-            normalised = item.strip()
-            if normalised:
-                result.append(normalised)
-        return result
+        return [
+            stripped
+            for stripped in (
+                item.strip() for item in values if isinstance(item, str)
+            )
+            if stripped
+        ]
 
     skill_gaps = normalise_list("skill_gaps")
     recommendations = normalise_list("recommendations")
@@ -200,8 +224,7 @@ def _parse_response(content: str, language: str) -> Dict[str, Any]:
 
 async def _call_openai(prompt: str) -> str:
     try:
-        response = await asyncio.to_thread(
-            client.chat.completions.create,
+        response = await client.chat.completions.create(
             model=FEEDBACK_MODEL,
             response_format={"type": "json_object"},
             messages=[
@@ -3,18 +3,33 @@ AI Microservice - FastAPI application
 Handles embeddings, matching, and feedback generation using OpenAI API
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Dict, List, Optional
+from fastapi.responses import ORJSONResponse
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    ValidationError,
+    WithJsonSchema,
+)
+from typing import Annotated, Any, Dict, List, Optional
+import msgpack
+import numpy as np
+import orjson
 import os
 import asyncio
 import httpx
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 
-from app.embeddings import EmbeddingError, generate_embedding, generate_embeddings_batch
-from app.matcher import compute_matches
+from app.embeddings import (
+    EmbeddingError,
+    generate_embedding,
+    generate_embeddings_batch,
+)
+from app.openai_client import OPENAI_HTTP_CLIENT
+from app.matcher import compute_matches_batch_encoded, compute_matches_encoded
 from app.models import GraduateProfile, JobRequirements
 from app.feedback import generate_feedback_text, FeedbackGenerationError
 from app.questions import (
@@ -61,9 +76,30 @@ async def keep_alive_task():
             await asyncio.sleep(KEEP_ALIVE_INTERVAL)
 
 
+async def warm_openai_pool():
+    """Open a keep-alive connection to OpenAI before the first user request.
+
+    Without this the first call pays DNS + TLS handshake (often 100-300 ms)
+    on top of generation latency. Failures are harmless: the connection is
+    simply opened lazily as before.
+    """
+    try:
+        await OPENAI_HTTP_CLIENT.head(
+            "https://api.openai.com/v1/models",
+            headers={"Authorization": f"Bearer {os.getenv('OPENAI_API_KEY', '')}"},
+            timeout=5.0,
+        )
+        print("[Startup] OpenAI connection pool warmed")
+    except Exception as e:
+        print(f"[Startup] OpenAI pool warm-up skipped: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events."""
+    # Startup: warm the OpenAI pool without blocking readiness
+    asyncio.create_task(warm_openai_pool())
+
     # Startup: Start keep-alive task
     if KEEP_ALIVE_ENABLED:
         print(
@@ -85,12 +121,19 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             print("[Keep-Alive] Keep-alive task cancelled")
 
+    # Shutdown: close the shared OpenAI connection pool
+    await OPENAI_HTTP_CLIENT.aclose()
+
 
 app = FastAPI(
     title="Recruita AI Service",
     description="AI microservice for job matching and candidate evaluation",
     version="1.0.0",
     lifespan=lifespan,
+    # orjson encodes large float payloads (match factors, 3072-dim embedding
+    # lists) several times faster than stdlib json and serialises numpy
+    # arrays directly, skipping the per-element tolist() boxing.
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -103,6 +146,26 @@ app.add_middleware(
 )
 
 
+def _coerce_float32_vector(value: Any) -> np.ndarray:
+    array = np.asarray(value, dtype=np.float32)
+    if array.ndim != 1:
+        # Nulls and scalars coerce to 0-d arrays; reject them here so the
+        # request fails validation (422) instead of erroring in the matcher.
+        raise ValueError("Embedding must be a one-dimensional array of floats")
+    return array
+
+
+# Embeddings are converted to float32 ndarrays once at request validation,
+# so the matcher never traverses 3072 boxed Python floats per vector. The
+# explicit JSON schema keeps /openapi.json generable: pydantic cannot derive
+# one from a bare np.ndarray annotation.
+Float32Array = Annotated[
+    np.ndarray,
+    BeforeValidator(_coerce_float32_vector),
+    WithJsonSchema({"type": "array", "items": {"type": "number"}}),
+]
+
+
 # Request/Response models
 class EmbedRequest(BaseModel):
     text: str
@@ -157,13 +220,17 @@ class JobMetadata(BaseModel):
 
 
 class JobEmbedding(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     id: str
-    embedding: List[float]
+    embedding: Float32Array
     metadata: Optional[JobMetadata] = None
 
 
 class MatchRequest(BaseModel):
-    graduate_embedding: List[float]
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    graduate_embedding: Float32Array
     job_embeddings: List[JobEmbedding]
     graduate_metadata: Optional[GraduateMetadata] = None
     options: Optional[MatchOptions] = None
@@ -180,8 +247,10 @@ class MatchResponse(BaseModel):
 
 
 class GraduateMatchPayload(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     id: Optional[str] = None
-    embedding: List[float]
+    embedding: Float32Array
     metadata: Optional[GraduateMetadata] = None
 
 
@@ -200,6 +269,46 @@ class MatchBatchResponse(BaseModel):
     results: List[MatchBatchItem]
 
 
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+
+def _decode_binary_embedding(value: Any) -> Any:
+    """Interpret packed little-endian float32 bytes as an ndarray, zero-copy."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return np.frombuffer(value, dtype=np.float32)
+    return value
+
+
+def _decode_msgpack_match(body: bytes) -> Any:
+    """
+    Decode a msgpack /match payload. Embeddings may arrive as raw float32
+    bytes, which np.frombuffer views without copying — a 3072-dim vector is
+    12 KB of binary versus ~60 KB of JSON text plus per-float parsing.
+    """
+    payload = msgpack.unpackb(body, raw=False)
+    if isinstance(payload, dict):
+        if "graduate_embedding" in payload:
+            payload["graduate_embedding"] = _decode_binary_embedding(
+                payload["graduate_embedding"]
+            )
+        for job in payload.get("job_embeddings") or []:
+            if isinstance(job, dict) and "embedding" in job:
+                job["embedding"] = _decode_binary_embedding(job["embedding"])
+    return payload
+
+
+def _job_payload(job: JobEmbedding) -> dict:
+    """
+    Build the matcher payload without model_dump-ing the embedding: attribute
+    access hands over the existing float list instead of copying D floats per
+    job into a fresh dict.
+    """
+    payload: dict = {"id": job.id, "embedding": job.embedding}
+    if job.metadata is not None:
+        payload["metadata"] = job.metadata.model_dump(exclude_none=True)
+    return payload
+
+
 class AssessmentQuestion(BaseModel):
     question: str
     options: List[str]
@@ -264,7 +373,12 @@ async def health_check():
     }
 
 
-@app.post("/embed", response_model=EmbedResponse)
+# The embed endpoints document their schema via `responses` instead of
+# `response_model` and return ORJSONResponse instances directly: a Response
+# subclass bypasses FastAPI's jsonable_encoder (which rejects ndarrays), so
+# orjson serialises the float32 ndarray in one pass rather than
+# round-tripping 3072 boxed floats.
+@app.post("/embed", responses={200: {"model": EmbedResponse}})
 async def embed_text(request: EmbedRequest):
     """
     Generate embedding for a given text using OpenAI text-embedding-3-large
@@ -280,7 +394,7 @@ async def embed_text(request: EmbedRequest):
             raise HTTPException(status_code=400, detail="Text cannot be empty")
 
         embedding = await generate_embedding(request.text)
-        return EmbedResponse(embedding=embedding)
+        return ORJSONResponse({"embedding": embedding.astype(np.float32)})
 
     except EmbeddingError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
@@ -290,7 +404,7 @@ async def embed_text(request: EmbedRequest):
         )
 
 
-@app.post("/embed/batch", response_model=EmbedBatchResponse)
+@app.post("/embed/batch", responses={200: {"model": EmbedBatchResponse}})
 async def embed_texts_batch(request: EmbedBatchRequest):
     """
     Generate embeddings for a batch of texts.
@@ -300,7 +414,13 @@ async def embed_texts_batch(request: EmbedBatchRequest):
             raise HTTPException(status_code=400, detail="Texts list cannot be empty")
 
         embeddings = await generate_embeddings_batch(request.texts)
-        return EmbedBatchResponse(embeddings=embeddings)
+        return ORJSONResponse(
+            {
+                "embeddings": [
+                    embedding.astype(np.float32) for embedding in embeddings
+                ]
+            }
+        )
 
     except EmbeddingError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
@@ -310,19 +430,48 @@ async def embed_texts_batch(request: EmbedBatchRequest):
         )
 
 
-@app.post("/match", response_model=MatchResponse)
-async def match_candidate(request: MatchRequest):
+@app.post(
+    "/match",
+    response_model=MatchResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {},
+                MSGPACK_CONTENT_TYPE: {},
+            },
+        },
+    },
+)
+async def match_candidate(raw_request: Request):
     """
     Compute similarity between graduate embedding and job embeddings
 
-    Args:
-        request: Contains graduate embedding and list of job embeddings
+    Accepts the usual JSON body, or Content-Type application/msgpack where
+    embeddings are packed float32 bytes — roughly half the wire size and no
+    per-float text parsing.
 
     Returns:
         Ranked list of matches with scores
     """
+    body = await raw_request.body()
+    content_type = raw_request.headers.get("content-type", "")
     try:
-        if not request.graduate_embedding:
+        if content_type.startswith(MSGPACK_CONTENT_TYPE):
+            payload = _decode_msgpack_match(body)
+        else:
+            payload = orjson.loads(body)
+        request = MatchRequest.model_validate(payload)
+    except ValidationError as exc:
+        raise HTTPException(
+            status_code=422,
+            detail=exc.errors(include_url=False, include_context=False),
+        )
+    except ValueError as exc:  # malformed JSON / msgpack
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    try:
+        if request.graduate_embedding.size == 0:
             raise HTTPException(
                 status_code=400, detail="Graduate embedding is required"
             )
@@ -330,9 +479,12 @@ async def match_candidate(request: MatchRequest):
         if not request.job_embeddings:
             raise HTTPException(status_code=400, detail="Job embeddings are required")
 
-        matches = await compute_matches(
+        # The matcher hands back the orjson-encoded result list (the same
+        # bytes it caches), which is spliced into the response body directly
+        # — no dict reconstruction or Pydantic output walk on hit or miss.
+        matches_payload = await compute_matches_encoded(
             request.graduate_embedding,
-            [job.model_dump(exclude_none=True) for job in request.job_embeddings],
+            [_job_payload(job) for job in request.job_embeddings],
             (
                 request.graduate_metadata.model_dump(exclude_none=True)
                 if request.graduate_metadata
@@ -341,7 +493,10 @@ async def match_candidate(request: MatchRequest):
             request.options.model_dump(exclude_none=True) if request.options else None,
         )
 
-        return MatchResponse(matches=[MatchItem(**match) for match in matches])
+        return Response(
+            content=b'{"matches":' + matches_payload + b"}",
+            media_type="application/json",
+        )
 
     except HTTPException:
         raise
@@ -364,34 +519,47 @@ async def match_candidates_batch(request: MatchBatchRequest):
         if not request.job_embeddings:
             raise HTTPException(status_code=400, detail="Job embeddings are required")
 
-        job_payload = [
-            job.model_dump(exclude_none=True) for job in request.job_embeddings
-        ]
+        job_payload = [_job_payload(job) for job in request.job_embeddings]
         options_payload = (
             request.options.model_dump(exclude_none=True) if request.options else None
         )
 
-        results: List[MatchBatchItem] = []
-        for graduate in request.graduates:
-            metadata_payload = (
-                graduate.metadata.model_dump(exclude_none=True)
-                if graduate.metadata
-                else None
-            )
-            matches = await compute_matches(
-                graduate.embedding,
-                job_payload,
-                metadata_payload,
-                options_payload,
-            )
-            results.append(
-                MatchBatchItem(
-                    graduate_id=graduate.id,
-                    matches=[MatchItem(**match) for match in matches],
-                )
+        # All graduates are fused into one (G, J) GEMM inside the matcher
+        # rather than issuing G separate matvecs.
+        graduate_payloads = [
+            {
+                "id": graduate.id,
+                "embedding": graduate.embedding,
+                "metadata": (
+                    graduate.metadata.model_dump(exclude_none=True)
+                    if graduate.metadata
+                    else None
+                ),
+            }
+            for graduate in request.graduates
+        ]
+        matches_per_graduate = await compute_matches_batch_encoded(
+            graduate_payloads, job_payload, options_payload
+        )
+
+        # Each per-graduate payload is already encoded (and cached) bytes;
+        # the response body is assembled by splicing rather than re-walking
+        # thousands of result dicts through Pydantic.
+        items = [
+            b'{"graduate_id":'
+            + orjson.dumps(graduate.id)
+            + b',"matches":'
+            + matches_payload
+            + b"}"
+            for graduate, matches_payload in zip(
+                request.graduates, matches_per_graduate
             )
+        ]
 
-        return MatchBatchResponse(results=results)
+        return Response(
+            content=b'{"results":[' + b",".join(items) + b"]}",
+            media_type="application/json",
+        )
 
     except HTTPException:
         raise
@@ -0,0 +1,43 @@
+"""
+Shared OpenAI client for the AI microservice.
+
+Responsibilities:
+  * Validate the API key once for every feature module
+  * Own the single HTTP connection pool used by all OpenAI calls
+  * Expose one AsyncOpenAI client that embeddings, feedback, and
+    questions import instead of constructing their own
+"""
+
+from __future__ import annotations
+
+import os
+
+import httpx
+from openai import AsyncOpenAI
+from dotenv import load_dotenv
+
+# Load environment variables before accessing them
+load_dotenv()
+
+_api_key = os.getenv("OPENAI_API_KEY")
+if not _api_key:
+    raise RuntimeError(
+        "OPENAI_API_KEY environment variable is required for the AI service"
+    )
+
+# One explicit connection pool shared by every OpenAI call in the service
+# (embeddings, feedback, questions): keep-alive connections warmed by any
+# module are reused by the others, and cold-start DNS + TLS handshakes are
+# paid once per connection rather than once per client. Closed on shutdown
+# by the FastAPI lifespan hook in app.main.
+OPENAI_HTTP_CLIENT = httpx.AsyncClient(
+    limits=httpx.Limits(
+        max_keepalive_connections=int(
+            os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "50")
+        ),
+        max_connections=int(os.getenv("OPENAI_MAX_CONNECTIONS", "200")),
+        keepalive_expiry=float(os.getenv("OPENAI_KEEPALIVE_EXPIRY_SECONDS", "300")),
+    ),
+)
+
+async_client = AsyncOpenAI(api_key=_api_key, http_client=OPENAI_HTTP_CLIENT)
@@ -10,40 +10,67 @@ Responsibilities:
 from __future__ import annotations
 
 import asyncio
-import json
+import functools
+import hashlib
 import logging
 import os
-from typing import Final, List, Optional, TypedDict
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import (
+    AsyncIterator,
+    Dict,
+    Final,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypedDict,
+)
 
 from openai import (
-    APIConnectionError,
-    APIError,
     APITimeoutError,
-    BadRequestError,
-    OpenAI,
     OpenAIError,
     RateLimitError,
 )
 from dotenv import load_dotenv
 
+import numpy as np
+import orjson
+
+from app import cache as shared_cache
+from app.embeddings import EmbeddingError, generate_embedding
+from app.openai_client import async_client as client
+
 # Load environment variables before accessing them
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
-_api_key = os.getenv("OPENAI_API_KEY")
-if not _api_key:
-    raise RuntimeError(
-        "OPENAI_API_KEY environment variable is required for question generation"
-    )
-
-client = OpenAI(api_key=_api_key)
-
 ASSESSMENT_MODEL: Final[str] = os.getenv(
     "ASSESSMENT_MODEL", os.getenv("FEEDBACK_MODEL", "gpt-4o-mini")
 )
 ASSESSMENT_TEMPERATURE: Final[float] = float(os.getenv("ASSESSMENT_TEMPERATURE", "0.3"))
 ASSESSMENT_MAX_TOKENS: Final[int] = int(os.getenv("ASSESSMENT_MAX_TOKENS", "1000"))
+ASSESSMENT_CACHE_TTL_SECONDS: Final[int] = int(
+    os.getenv("ASSESSMENT_CACHE_TTL_SECONDS", "3600")
+)
+ASSESSMENT_CACHE_MAX_ENTRIES: Final[int] = int(
+    os.getenv("ASSESSMENT_CACHE_MAX_ENTRIES", "1024")
+)
+ASSESSMENT_SEMANTIC_CACHE_THRESHOLD: Final[float] = float(
+    os.getenv("ASSESSMENT_SEMANTIC_CACHE_THRESHOLD", "0.92")
+)
+ASSESSMENT_SEMANTIC_CACHE_MAX_ENTRIES: Final[int] = int(
+    os.getenv("ASSESSMENT_SEMANTIC_CACHE_MAX_ENTRIES", "256")
+)
+ASSESSMENT_MAX_CONCURRENCY: Final[int] = int(
+    os.getenv("ASSESSMENT_MAX_CONCURRENCY", "8")
+)
+ASSESSMENT_BATCH_MAX: Final[int] = int(os.getenv("ASSESSMENT_BATCH_MAX", "8"))
+ASSESSMENT_BATCH_WINDOW_SECONDS: Final[float] = float(
+    os.getenv("ASSESSMENT_BATCH_WINDOW_SECONDS", "0.05")
+)
 
 
 class QuestionGenerationError(RuntimeError):
@@ -57,31 +84,119 @@ class AssessmentQuestion(TypedDict):
     skill: Optional[str]
 
 
-def _serialise_skills(skills: List[str]) -> str:
+# Identical (skills, attempt, num_questions, language) tuples repeat across
+# users, and each repeat is otherwise a full OpenAI round-trip. The cache key
+# goes through _canonical_skills so skill order, case, and whitespace collapse
+# to one entry; concurrent duplicates coalesce onto one in-flight request via
+# _pending futures, mirroring the single-flight pattern in app.embeddings.
+_CacheKey = Tuple[str, int, int, str]
+
+
+@dataclass
+class _CacheEntry:
+    value: List[AssessmentQuestion]
+    expires_at: float
+
+
+_question_cache: "OrderedDict[_CacheKey, _CacheEntry]" = OrderedDict()
+_cache_lock = asyncio.Lock()
+_pending: Dict[_CacheKey, "asyncio.Future[List[AssessmentQuestion]]"] = {}
+
+
+def _shared_cache_key(key: _CacheKey) -> str:
+    """Opaque cross-worker key for app.cache; hashed so skill strings of any
+    length or content stay within Redis key conventions."""
+    return "questions:" + hashlib.sha256(orjson.dumps(key)).hexdigest()
+
+
+# Semantically equivalent skill sets ("React, TS" vs "ReactJS, TypeScript")
+# miss the exact cache but still describe the same assessment. Each generated
+# set is stored alongside an L2-normalised embedding of its skill string;
+# lookups embed the incoming string and accept the best dot product above
+# ASSESSMENT_SEMANTIC_CACHE_THRESHOLD, restricted to the exact
+# (attempt, num_questions, language) context to avoid false hits across
+# different assessment shapes. An embedding call is itself cached and far
+# cheaper than a 1000-token chat completion.
+@dataclass
+class _SemanticEntry:
+    vector: np.ndarray  # L2-normalised float32 skill-string embedding
+    context: Tuple[int, int, str]  # (attempt, num_questions, language)
+    value: List[AssessmentQuestion]
+
+
+_semantic_cache: List[_SemanticEntry] = []
+
+
+async def _embed_skill_text(skill_text: str) -> Optional[np.ndarray]:
+    try:
+        raw = await generate_embedding(skill_text)
+    except EmbeddingError as exc:
+        logger.debug("Semantic question cache unavailable: %s", exc)
+        return None
+    vector = np.asarray(raw, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    if norm == 0.0:
+        return None
+    return vector / norm
+
+
+def _semantic_lookup(
+    vector: np.ndarray, context: Tuple[int, int, str]
+) -> Optional[List[AssessmentQuestion]]:
+    candidates = [entry for entry in _semantic_cache if entry.context == context]
+    if not candidates:
+        return None
+    scores = np.stack([entry.vector for entry in candidates]) @ vector
+    best = int(np.argmax(scores))
+    if float(scores[best]) >= ASSESSMENT_SEMANTIC_CACHE_THRESHOLD:
+        return candidates[best].value
+    return None
+
+
+def _semantic_store(
+    vector: np.ndarray,
+    context: Tuple[int, int, str],
+    value: List[AssessmentQuestion],
+) -> None:
+    _semantic_cache.append(
+        _SemanticEntry(vector=vector, context=context, value=value)
+    )
+    while len(_semantic_cache) > ASSESSMENT_SEMANTIC_CACHE_MAX_ENTRIES:
+        _semantic_cache.pop(0)
+
+
+@functools.lru_cache(maxsize=4096)
+def _canonical_skills(skills: Tuple[str, ...]) -> str:
+    """Sorted, deduplicated form for cache keys: ["a","b"] and ["b","a"]
+    must collide."""
     return ", ".join(sorted({skill.strip() for skill in skills if skill.strip()}))
 
 
-def _build_prompt(
-    skills: List[str],
-    *,
-    attempt: int,
-    num_questions: int,
-    language: str,
-) -> str:
-    skill_list = _serialise_skills(skills)
-    return f"""
-You are an experienced technical interviewer. Draft {num_questions} \
-multiple-choice questions in {language.upper()} that assess a graduate's \
-proficiency with the following skills: {skill_list or "general web development"}.
+@functools.lru_cache(maxsize=4096)
+def _display_skills(skills: Tuple[str, ...]) -> str:
+    """Deduplicated form for prompts; dict.fromkeys keeps the caller's order
+    (still deterministic) and skips the sort."""
+    return ", ".join(
+        dict.fromkeys(skill.strip() for skill in skills if skill.strip())
+    )
 
-Attempt number: {attempt}. Ensure this set differs from earlier attempts \
-by varying the focus and wording.
+
+# Built once at import; _build_prompt only substitutes the dynamic fields
+# instead of re-assembling the full prompt per request. All invariant text
+# comes first and the per-request fields sit in one delimited block at the
+# end, so every call shares the longest possible prompt prefix and benefits
+# from server-side prompt caching on the model.
+_PROMPT_TEMPLATE: Final[str] = """
+You are an experienced technical interviewer. Draft multiple-choice \
+questions that assess a graduate's proficiency with the skills specified \
+at the end of this prompt.
 
 Guidelines:
 - Each question must emphasise one primary skill; reflect that in the "skill" field.
 - Provide 4 distinct answer options per question.
 - Include exactly one correct answer per question, matching one of the options verbatim.
 - Avoid trivial definitions; prefer practical, scenario-based questions when possible.
+- Ensure each attempt differs from earlier attempts by varying the focus and wording.
 
 Respond with JSON in the following shape:
 {{
@@ -95,123 +210,609 @@ Respond with JSON in the following shape:
     ...
   ]
 }}
+
+Specification:
+- Number of questions: {num_questions}
+- Language: {language}
+- Skills: {skill_list}
+- Attempt number: {attempt}
 """.strip()
 
 
-def _parse_questions(payload: str) -> List[AssessmentQuestion]:
+# Pure over a small, often-repeated input space; memoized so warm inputs
+# (batching, multi-attempt fan-out) get the prompt back as a dict lookup.
+@functools.lru_cache(maxsize=1024)
+def _build_prompt(
+    skill_list: str,
+    *,
+    attempt: int,
+    num_questions: int,
+    language: str,
+) -> str:
+    return _PROMPT_TEMPLATE.format_map(
+        {
+            "num_questions": num_questions,
+            "language": language.upper(),
+            "skill_list": skill_list or "general web development",
+            "attempt": attempt,
+        }
+    )
+
+
+# Structured-output schemas. With strict mode the model is constrained to
+# these shapes, so the parsers only need to enforce the one invariant JSON
+# Schema cannot express: the answer must match one of the options verbatim.
+_QUESTION_ITEM_SCHEMA: Final[Dict[str, object]] = {
+    "type": "object",
+    "properties": {
+        "question": {"type": "string"},
+        "options": {"type": "array", "items": {"type": "string"}},
+        "answer": {"type": "string"},
+        "skill": {"type": ["string", "null"]},
+    },
+    "required": ["question", "options", "answer", "skill"],
+    "additionalProperties": False,
+}
+
+_ASSESSMENT_RESPONSE_FORMAT: Final[Dict[str, object]] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "assessment",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "questions": {"type": "array", "items": _QUESTION_ITEM_SCHEMA},
+            },
+            "required": ["questions"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+_BATCH_RESPONSE_FORMAT: Final[Dict[str, object]] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "assessment_batches",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "batches": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "questions": {
+                                "type": "array",
+                                "items": _QUESTION_ITEM_SCHEMA,
+                            },
+                        },
+                        "required": ["questions"],
+                        "additionalProperties": False,
+                    },
+                },
+            },
+            "required": ["batches"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+def _parse_questions(
+    payload: str, limit: Optional[int] = None
+) -> List[AssessmentQuestion]:
     try:
-        data = json.loads(payload)
-    except json.JSONDecodeError as exc:
+        data = orjson.loads(payload)
+    except orjson.JSONDecodeError as exc:
         logger.error("Unable to parse question JSON: %s", exc)
         raise QuestionGenerationError(
             "Question generation returned invalid JSON"
         ) from exc
 
-    questions = data.get("questions")
+    # The schema guarantees shape and types; only the answer-in-options
+    # invariant needs a Python-side check. Stop once the caller's quota is
+    # filled so a drifting model returning extra questions costs nothing.
+    questions: List[AssessmentQuestion] = []
+    for item in data.get("questions") or []:
+        if item.get("answer") in (item.get("options") or ()):
+            questions.append(item)
+            if limit is not None and len(questions) >= limit:
+                break
+    if not questions:
+        raise QuestionGenerationError("No valid questions were generated")
+    return questions
+
+
+def _normalise_questions(
+    questions: object, limit: Optional[int] = None
+) -> List[AssessmentQuestion]:
     if not isinstance(questions, list) or not questions:
         raise QuestionGenerationError("Question generation returned no questions")
 
     normalised: List[AssessmentQuestion] = []
     for item in questions:
-        if not isinstance(item, dict):
-            continue
-        question_text = str(item.get("question", "")).strip()
-        options = item.get("options")
-        answer = str(item.get("answer", "")).strip()
-        skill = item.get("skill")
-
-        if (
-            not question_text
-            or not isinstance(options, list)
-            or len(options) < 2
-            or not answer
-        ):
-            continue
-
-        cleaned_options = []
-        for option in options:
-            if isinstance(option, str):
-                trimmed = option.strip()
-                if trimmed:
-                    cleaned_options.append(trimmed)
-
-        if len(cleaned_options) < 2:
-            continue
-
-        if answer not in cleaned_options:
-            # Fallback: if answer differs by case/spacing, try to match.
-            matches = [opt for opt in cleaned_options if opt.lower() == answer.lower()]
-            if matches:
-                answer = matches[0]
-            else:
+        question = _normalise_question_item(item)
+        if question is not None:
+            normalised.append(question)
+            if limit is not None and len(normalised) >= limit:
+                break
+
+    if not normalised:
+        raise QuestionGenerationError("No valid questions were generated")
+
+    return normalised
+
+
+def _normalise_question_item(item: object) -> Optional[AssessmentQuestion]:
+    """Validate and clean one raw question object; None when unusable."""
+    if not isinstance(item, dict):
+        return None
+    question_text = str(item.get("question", "")).strip()
+    options = item.get("options")
+    answer = str(item.get("answer", "")).strip()
+    skill = item.get("skill")
+
+    if (
+        not question_text
+        or not isinstance(options, list)
+        or len(options) < 2
+        or not answer
+    ):
+        return None
+
+    cleaned_options = [
+        stripped
+        for stripped in (
+            option.strip() for option in options if isinstance(option, str)
+        )
+        if stripped
+    ]
+
+    if len(cleaned_options) < 2:
+        return None
+
+    if answer not in cleaned_options:
+        # Fallback: if answer differs by case, match via one dict build
+        # instead of scanning the options per candidate.
+        lower_map = {option.lower(): option for option in cleaned_options}
+        answer = lower_map.get(answer.lower())
+        if answer is None:
+            return None
+
+    return AssessmentQuestion(
+        question=question_text,
+        options=cleaned_options,
+        answer=answer,
+        skill=(
+            str(skill).strip()
+            if isinstance(skill, str) and skill.strip()
+            else None
+        ),
+    )
+
+
+class _QuestionObjectScanner:
+    """
+    Incremental scanner emitting completed objects from the first JSON array
+    in a token stream — the "questions" array in the response schema. Only
+    string/escape state and bracket depth are tracked, so each streamed chunk
+    is scanned once; nothing is re-parsed as the buffer grows.
+    """
+
+    def __init__(self) -> None:
+        self._in_string = False
+        self._escape = False
+        self._depth = 0
+        self._array_depth: Optional[int] = None
+        self._object_depth: Optional[int] = None
+        self._object_chars: List[str] = []
+
+    def feed(self, text: str) -> List[str]:
+        """Consume a chunk and return any question objects it completed."""
+        completed: List[str] = []
+        for char in text:
+            if self._object_depth is not None:
+                self._object_chars.append(char)
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
                 continue
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                if char == "[" and self._array_depth is None:
+                    self._array_depth = self._depth
+                elif (
+                    char == "{"
+                    and self._array_depth is not None
+                    and self._depth == self._array_depth + 1
+                ):
+                    self._object_depth = self._depth
+                    self._object_chars = ["{"]
+            elif char in "}]":
+                self._depth -= 1
+                if (
+                    self._object_depth is not None
+                    and self._depth < self._object_depth
+                ):
+                    completed.append("".join(self._object_chars))
+                    self._object_chars = []
+                    self._object_depth = None
+        return completed
+
+
+def _build_batch_prompt(requests: List["_BatchRequest"]) -> str:
+    sections = []
+    for index, request in enumerate(requests, start=1):
+        skill_list = (
+            _display_skills(tuple(request.skills)) or "general web development"
+        )
+        sections.append(
+            f"Set {index}: {request.num_questions} questions in "
+            f"{request.language.upper()} assessing: {skill_list}. "
+            f"Attempt number: {request.attempt}."
+        )
+    section_block = "\n".join(sections)
+    # Static preamble first, variable specifications last: batch calls then
+    # share the same cached prompt prefix as each other regardless of which
+    # requests landed in the window.
+    return f"""
+You are an experienced technical interviewer. Draft independent \
+multiple-choice question sets, one per specification at the end of this \
+prompt.
+
+Guidelines (apply to every set):
+- Each question must emphasise one primary skill; reflect that in the "skill" field.
+- Provide 4 distinct answer options per question.
+- Include exactly one correct answer per question, matching one of the options verbatim.
+- Avoid trivial definitions; prefer practical, scenario-based questions when possible.
+- Vary focus and wording across attempts of the same skills.
+
+Respond with JSON in the following shape, with exactly one entry in \
+"batches" per specification, in the same order as the sets below:
+{{
+  "batches": [
+    {{
+      "questions": [
+        {{
+          "question": "Question text",
+          "options": ["Option A", "Option B", "Option C", "Option D"],
+          "answer": "Correct option (must match one entry in options)",
+          "skill": "Primary skill assessed"
+        }},
+        ...
+      ]
+    }},
+    ...
+  ]
+}}
+
+Specifications ({len(requests)} sets):
+{section_block}
+""".strip()
 
-        normalised.append(
-            AssessmentQuestion(
-                question=question_text,
-                options=cleaned_options,
-                answer=answer,
-                skill=(
-                    str(skill).strip()
-                    if isinstance(skill, str) and skill.strip()
-                    else None
-                ),
+
+def _parse_question_batches(
+    payload: str, expected: int, limits: Optional[List[int]] = None
+) -> List["List[AssessmentQuestion] | QuestionGenerationError"]:
+    """Split a batched response into per-caller results.
+
+    A malformed outer document fails every caller; a single invalid set only
+    fails the caller that requested it.
+    """
+    try:
+        data = orjson.loads(payload)
+    except orjson.JSONDecodeError as exc:
+        logger.error("Unable to parse batched question JSON: %s", exc)
+        raise QuestionGenerationError(
+            "Question generation returned invalid JSON"
+        ) from exc
+
+    batches = data.get("batches")
+    if not isinstance(batches, list) or len(batches) != expected:
+        raise QuestionGenerationError(
+            "Question generation returned a malformed batch response"
+        )
+
+    results: List["List[AssessmentQuestion] | QuestionGenerationError"] = []
+    for index, item in enumerate(batches):
+        try:
+            questions = item.get("questions") if isinstance(item, dict) else None
+            results.append(
+                _normalise_questions(
+                    questions, limit=limits[index] if limits else None
+                )
             )
+        except QuestionGenerationError as exc:
+            results.append(exc)
+    return results
+
+
+@dataclass
+class _BatchRequest:
+    skills: List[str]
+    attempt: int
+    num_questions: int
+    language: str
+    future: "asyncio.Future[List[AssessmentQuestion]]"
+
+
+class _QuestionBatcher:
+    """
+    Coalesces generation requests arriving within a short window into one
+    chat completion asking for several question sets at once. Concurrent
+    traffic then consumes one request against OpenAI's RPM budget per window
+    instead of one per caller; an idle service still issues plain single-set
+    calls so the response contract is unchanged.
+    """
+
+    def __init__(self) -> None:
+        self._pending: List[_BatchRequest] = []
+        self._collecting = False
+
+    async def generate(
+        self,
+        skills: List[str],
+        attempt: int,
+        num_questions: int,
+        language: str,
+    ) -> List[AssessmentQuestion]:
+        loop = asyncio.get_running_loop()
+        request = _BatchRequest(
+            skills=skills,
+            attempt=attempt,
+            num_questions=num_questions,
+            language=language,
+            future=loop.create_future(),
         )
+        self._pending.append(request)
+
+        # The first arrival leads the window: it sleeps, then executes the
+        # whole batch. Followers merely await their futures.
+        if not self._collecting:
+            self._collecting = True
+            try:
+                await asyncio.sleep(ASSESSMENT_BATCH_WINDOW_SECONDS)
+            finally:
+                batch, self._pending = self._pending, []
+                self._collecting = False
+                chunks = [
+                    batch[start : start + ASSESSMENT_BATCH_MAX]
+                    for start in range(0, len(batch), ASSESSMENT_BATCH_MAX)
+                ]
+                # Started inside the finally so a leader cancelled mid-window
+                # (client disconnect) still detaches the batch; the gathered
+                # tasks run on and resolve every follower's future instead of
+                # leaving them hanging.
+                execution = asyncio.gather(
+                    *(self._execute(chunk) for chunk in chunks)
+                )
+            # Shielded: the leader is just another caller, and cancelling it
+            # during the OpenAI round-trip must not propagate into the shared
+            # batch and fail the followers coalesced behind it.
+            await asyncio.shield(execution)
+
+        return await asyncio.shield(request.future)
+
+    async def _execute(self, chunk: List[_BatchRequest]) -> None:
+        try:
+            if len(chunk) == 1:
+                request = chunk[0]
+                prompt = _build_prompt(
+                    _display_skills(tuple(request.skills)),
+                    attempt=request.attempt,
+                    num_questions=request.num_questions,
+                    language=request.language,
+                )
+                raw = await _call_openai(prompt)
+                outcomes: List[
+                    "List[AssessmentQuestion] | QuestionGenerationError"
+                ] = [_parse_questions(raw, limit=max(request.num_questions, 1))]
+            else:
+                prompt = _build_batch_prompt(chunk)
+                raw = await _call_openai(
+                    prompt,
+                    max_tokens=ASSESSMENT_MAX_TOKENS * len(chunk),
+                    response_format=_BATCH_RESPONSE_FORMAT,
+                )
+                outcomes = _parse_question_batches(
+                    raw,
+                    expected=len(chunk),
+                    limits=[max(r.num_questions, 1) for r in chunk],
+                )
+        except BaseException as exc:
+            for request in chunk:
+                if not request.future.done():
+                    request.future.set_exception(exc)
+                    request.future.exception()
+            return
+
+        for request, outcome in zip(chunk, outcomes):
+            if request.future.done():
+                continue
+            if isinstance(outcome, QuestionGenerationError):
+                request.future.set_exception(outcome)
+                request.future.exception()
+            else:
+                request.future.set_result(outcome)
 
-    if not normalised:
-        raise QuestionGenerationError("No valid questions were generated")
 
-    return normalised
+_question_batcher = _QuestionBatcher()
 
 
-async def _call_openai(prompt: str) -> str:
+async def _call_openai(
+    prompt: str,
+    max_tokens: Optional[int] = None,
+    response_format: Dict[str, object] = _ASSESSMENT_RESPONSE_FORMAT,
+) -> str:
     try:
-        response = await asyncio.to_thread(
-            client.chat.completions.create,
+        response = await client.chat.completions.create(
             model=ASSESSMENT_MODEL,
-            response_format={"type": "json_object"},
+            response_format=response_format,
             messages=[
                 {
                     "role": "system",
                     "content": (
-                        "You generate rigorous technical multiple-choice questions. "
-                        "Always respond with valid JSON matching the requested schema."
+                        "You generate rigorous technical multiple-choice "
+                        "questions. Always respond with valid JSON matching "
+                        "the requested schema."
                     ),
                 },
                 {"role": "user", "content": prompt},
             ],
             temperature=ASSESSMENT_TEMPERATURE,
-            max_tokens=ASSESSMENT_MAX_TOKENS,
+            max_tokens=max_tokens or ASSESSMENT_MAX_TOKENS,
         )
     except (RateLimitError, APITimeoutError) as exc:
         logger.warning("Question generation rate limited or timed out: %s", exc)
         raise QuestionGenerationError(
             "Question service is currently unavailable. Please retry shortly."
         ) from exc
-    except (BadRequestError, APIConnectionError, APIError) as exc:
+    except OpenAIError as exc:
+        # Covers APIError, BadRequestError, and APIConnectionError; anything
+        # outside the OpenAI hierarchy propagates to the ASGI layer.
         logger.error("Question generation API error: %s", exc)
         raise QuestionGenerationError(
             "Question service rejected the request payload."
         ) from exc
+
+    content = getattr(
+        getattr(response.choices[0], "message", None), "content", None
+    )
+    if not content:
+        raise QuestionGenerationError("Question generation returned an empty response.")
+    return content
+
+
+async def _stream_question_objects(prompt: str) -> AsyncIterator[str]:
+    """Stream a completion and yield raw question-object strings as they close."""
+    try:
+        stream = await client.chat.completions.create(
+            model=ASSESSMENT_MODEL,
+            response_format=_ASSESSMENT_RESPONSE_FORMAT,
+            messages=[
+                {
+                    "role": "system",
+                    "content": (
+                        "You generate rigorous technical multiple-choice "
+                        "questions. Always respond with valid JSON matching "
+                        "the requested schema."
+                    ),
+                },
+                {"role": "user", "content": prompt},
+            ],
+            temperature=ASSESSMENT_TEMPERATURE,
+            max_tokens=ASSESSMENT_MAX_TOKENS,
+            stream=True,
+        )
     except OpenAIError as exc:
-        logger.exception("Unexpected OpenAI error during question generation")
+        logger.error("Question stream request failed: %s", exc)
         raise QuestionGenerationError(
-            "Unexpected error from question service."
+            "Question service is currently unavailable. Please retry shortly."
         ) from exc
-    except Exception as exc:  # pragma: no cover
-        logger.exception("Unhandled error during question generation")
+
+    scanner = _QuestionObjectScanner()
+    try:
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            content = getattr(chunk.choices[0].delta, "content", None)
+            if not content:
+                continue
+            for object_text in scanner.feed(content):
+                yield object_text
+    except OpenAIError as exc:
+        logger.warning("Question stream interrupted: %s", exc)
         raise QuestionGenerationError(
-            "Unable to generate assessment questions."
+            "Question service interrupted the response stream."
         ) from exc
 
-    choice = response.choices[0]
-    content = (
-        choice.message.content if choice.message and choice.message.content else ""
+
+async def generate_assessment_questions_stream(
+    skills: List[str],
+    *,
+    attempt: int = 1,
+    num_questions: int = 5,
+    language: str = "en",
+) -> AsyncIterator[AssessmentQuestion]:
+    """
+    Yield validated questions as the model emits them instead of waiting for
+    the full completion — the first question arrives after roughly 1/N of the
+    generation time for an N-question set. Closing the generator early tears
+    down the HTTP stream, so abandoned requests stop token generation.
+    Complete sets still land in the exact-match cache, and cached sets are
+    replayed without a network call.
+    """
+    if not skills:
+        raise QuestionGenerationError(
+            "At least one skill is required to generate questions."
+        )
+
+    attempt = max(attempt, 1)
+    num_questions = max(num_questions, 1)
+    language = language or "en"
+    cache_key: _CacheKey = (
+        _canonical_skills(tuple(skills)).lower(),
+        attempt,
+        num_questions,
+        language.lower(),
     )
-    if not content:
-        raise QuestionGenerationError("Question generation returned an empty response.")
-    return content
+
+    async with _cache_lock:
+        entry = _question_cache.get(cache_key)
+        if entry and entry.expires_at >= time.monotonic():
+            _question_cache.move_to_end(cache_key)
+            cached = entry.value
+        else:
+            cached = None
+    if cached is not None:
+        for question in cached:
+            yield question
+        return
+
+    prompt = _build_prompt(
+        _display_skills(tuple(skills)),
+        attempt=attempt,
+        num_questions=num_questions,
+        language=language,
+    )
+    questions: List[AssessmentQuestion] = []
+    object_stream = _stream_question_objects(prompt)
+    async for object_text in object_stream:
+        try:
+            item = orjson.loads(object_text)
+        except orjson.JSONDecodeError as exc:
+            logger.error("Unable to parse streamed question JSON: %s", exc)
+            raise QuestionGenerationError(
+                "Question generation returned invalid JSON"
+            ) from exc
+        question = _normalise_question_item(item)
+        if question is not None:
+            questions.append(question)
+            yield question
+            if len(questions) >= num_questions:
+                # Quota filled: tear down the HTTP stream so the model stops
+                # generating (and billing) surplus questions.
+                await object_stream.aclose()
+                break
+
+    if not questions:
+        raise QuestionGenerationError("No valid questions were generated")
+
+    async with _cache_lock:
+        _question_cache[cache_key] = _CacheEntry(
+            value=questions,
+            expires_at=time.monotonic() + ASSESSMENT_CACHE_TTL_SECONDS,
+        )
+        while len(_question_cache) > ASSESSMENT_CACHE_MAX_ENTRIES:
+            _question_cache.popitem(last=False)
 
 
 async def generate_assessment_questions(
@@ -226,11 +827,127 @@ async def generate_assessment_questions(
             "At least one skill is required to generate questions."
         )
 
-    prompt = _build_prompt(
-        skills,
-        attempt=max(attempt, 1),
-        num_questions=max(num_questions, 1),
-        language=language or "en",
+    attempt = max(attempt, 1)
+    num_questions = max(num_questions, 1)
+    language = language or "en"
+    cache_key: _CacheKey = (
+        _canonical_skills(tuple(skills)).lower(),
+        attempt,
+        num_questions,
+        language.lower(),
+    )
+
+    async with _cache_lock:
+        entry = _question_cache.get(cache_key)
+        if entry:
+            if entry.expires_at >= time.monotonic():
+                _question_cache.move_to_end(cache_key)
+                return entry.value
+            _question_cache.pop(cache_key, None)
+
+        future = _pending.get(cache_key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            _pending[cache_key] = future
+            owner = True
+        else:
+            owner = False
+
+    if not owner:
+        return await asyncio.shield(future)
+
+    try:
+        # Cross-worker tier: another worker (or a previous deployment) may
+        # already hold this exact set.
+        shared_key = _shared_cache_key(cache_key)
+        payload = await shared_cache.get(shared_key)
+        questions: Optional[List[AssessmentQuestion]] = (
+            orjson.loads(payload) if payload is not None else None
+        )
+        if questions is None:
+            context = (attempt, num_questions, language.lower())
+            vector = await _embed_skill_text(cache_key[0])
+            questions = (
+                _semantic_lookup(vector, context) if vector is not None else None
+            )
+            if questions is None:
+                questions = await _question_batcher.generate(
+                    skills,
+                    attempt=attempt,
+                    num_questions=num_questions,
+                    language=language,
+                )
+                if vector is not None:
+                    _semantic_store(vector, context, questions)
+            await shared_cache.set(
+                shared_key, orjson.dumps(questions), ASSESSMENT_CACHE_TTL_SECONDS
+            )
+    except BaseException as exc:
+        async with _cache_lock:
+            _pending.pop(cache_key, None)
+        future.set_exception(exc)
+        future.exception()  # mark retrieved when nobody is waiting
+        raise
+
+    async with _cache_lock:
+        _question_cache[cache_key] = _CacheEntry(
+            value=questions,
+            expires_at=time.monotonic() + ASSESSMENT_CACHE_TTL_SECONDS,
+        )
+        while len(_question_cache) > ASSESSMENT_CACHE_MAX_ENTRIES:
+            _question_cache.popitem(last=False)
+        _pending.pop(cache_key, None)
+    future.set_result(questions)
+    return questions
+
+
+async def generate_assessment_questions_many(
+    skills: List[str],
+    *,
+    attempts: Optional[Sequence[int]] = None,
+    num_questions: int = 5,
+    language: str = "en",
+) -> Dict[int, List[AssessmentQuestion]]:
+    """
+    Generate several attempt variations concurrently instead of one await per
+    attempt, so K attempts cost roughly one generation latency. Each attempt
+    goes through generate_assessment_questions, keeping the caches and the
+    request batcher in play; a semaphore bounds the fan-out so a large K does
+    not trip OpenAI rate limits. Returns the attempts that succeeded, keyed
+    by attempt number, and raises only when every attempt fails.
+    """
+    if not skills:
+        raise QuestionGenerationError(
+            "At least one skill is required to generate questions."
+        )
+
+    attempt_numbers = sorted({max(a, 1) for a in (attempts or (1, 2, 3))})
+    semaphore = asyncio.Semaphore(ASSESSMENT_MAX_CONCURRENCY)
+
+    async def _one(attempt: int) -> List[AssessmentQuestion]:
+        async with semaphore:
+            return await generate_assessment_questions(
+                skills,
+                attempt=attempt,
+                num_questions=num_questions,
+                language=language,
+            )
+
+    outcomes = await asyncio.gather(
+        *(_one(attempt) for attempt in attempt_numbers), return_exceptions=True
     )
-    raw = await _call_openai(prompt)
-    return _parse_questions(raw)
+
+    results: Dict[int, List[AssessmentQuestion]] = {}
+    for attempt, outcome in zip(attempt_numbers, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.warning(
+                "Question generation failed for attempt %d: %s", attempt, outcome
+            )
+        else:
+            results[attempt] = outcome
+
+    if not results:
+        raise QuestionGenerationError(
+            "Question generation failed for every requested attempt."
+        )
+    return results
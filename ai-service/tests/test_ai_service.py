@@ -1,8 +1,11 @@
 import asyncio
+import importlib
 import json
 import os
+import sys
 import types
 import unittest
+from contextlib import ExitStack
 from typing import List
 from unittest.mock import AsyncMock, patch
 
@@ -11,29 +14,39 @@ os.environ.setdefault("OPENAI_API_KEY", "test-key")
 
 
 class _ImportOpenAIStub:
+    """Covers both sync and async OpenAI client entry points at import."""
+
     def __init__(self, *args, **kwargs):
         placeholder_embedding = types.SimpleNamespace(data=[])
         placeholder_completion = types.SimpleNamespace(choices=[])
+
+        async def _create_completion(*a, **k):
+            return placeholder_completion
+
         self.embeddings = types.SimpleNamespace(create=lambda *a, **k: placeholder_embedding)
         self.chat = types.SimpleNamespace(
-            completions=types.SimpleNamespace(create=lambda *a, **k: placeholder_completion)
+            completions=types.SimpleNamespace(create=_create_completion)
         )
 
 
-main_stub = types.ModuleType("app.main")
-main_stub.GraduateProfile = object  # type: ignore[attr-defined]
-main_stub.JobRequirements = object  # type: ignore[attr-defined]
-import sys
-
-sys.modules.setdefault("app.main", main_stub)
-
-with patch("openai.OpenAI", _ImportOpenAIStub):
-    import importlib
+# Import the app modules once under stubbed clients; repeat runs in the same
+# interpreter (unittest re-entry, other test modules) reuse the cached modules
+# instead of constructing fresh HTTP clients.
+if "app.questions" not in sys.modules:
+    with ExitStack() as _stack:
+        _stack.enter_context(patch("openai.OpenAI", _ImportOpenAIStub))
+        _stack.enter_context(patch("openai.AsyncOpenAI", _ImportOpenAIStub))
+        importlib.import_module("app.embeddings")
+        importlib.import_module("app.matcher")
+        importlib.import_module("app.feedback")
+        importlib.import_module("app.questions")
+        importlib.import_module("app.main")
 
-    embeddings = importlib.import_module("app.embeddings")
-    matcher = importlib.import_module("app.matcher")
-    feedback = importlib.import_module("app.feedback")
-    questions = importlib.import_module("app.questions")
+embeddings = sys.modules["app.embeddings"]
+matcher = sys.modules["app.matcher"]
+feedback = sys.modules["app.feedback"]
+questions = sys.modules["app.questions"]
+main = sys.modules["app.main"]
 
 
 class DummyEmbeddingsClient:
@@ -43,7 +56,7 @@ class DummyEmbeddingsClient:
         self.calls: List[List[str]] = []
         self.embeddings = types.SimpleNamespace(create=self._create)
 
-    def _create(self, model: str, input: List[str]):
+    async def _create(self, model: str, input: List[str]):
         self.calls.append(list(input))
         return types.SimpleNamespace(
             data=[
@@ -65,13 +78,24 @@ class EmbeddingTests(unittest.TestCase):
         self.assertEqual(self.client.calls, [["hello"]])
 
         second = asyncio.run(embeddings.generate_embeddings_batch(["hello"]))
-        self.assertEqual(second[0], result[0])
+        self.assertEqual(second[0].tolist(), result[0].tolist())
         self.assertEqual(len(self.client.calls), 1, "Expected cached result for duplicate text")
 
     def test_generate_profile_embedding_rejects_empty_text(self) -> None:
         with self.assertRaises(embeddings.EmbeddingError):
             asyncio.run(embeddings.generate_embeddings_batch(["   "]))
 
+    def test_concurrent_requests_for_same_text_coalesce(self) -> None:
+        async def run_concurrently():
+            return await asyncio.gather(
+                embeddings.generate_embedding("hello"),
+                embeddings.generate_embedding("hello"),
+            )
+
+        first, second = asyncio.run(run_concurrently())
+        self.assertEqual(first.tolist(), second.tolist())
+        self.assertEqual(len(self.client.calls), 1, "Expected coalesced OpenAI call")
+
 
 class MatcherTests(unittest.TestCase):
     def setUp(self) -> None:
@@ -121,6 +145,66 @@ class MatcherTests(unittest.TestCase):
         self.assertIn("factors", result[0])
 
 
+class EmbedEndpointTests(unittest.TestCase):
+    """Exercise the embed routes end to end, including response serialisation."""
+
+    def setUp(self) -> None:
+        from fastapi.testclient import TestClient
+
+        self.client_stub = DummyEmbeddingsClient()
+        embeddings._client = self.client_stub  # type: ignore[attr-defined]
+        embeddings._cache.clear()  # type: ignore[attr-defined]
+        self.http = TestClient(main.app)
+
+    def test_embed_endpoint_returns_embedding(self) -> None:
+        response = self.http.post("/embed", json={"text": "hello"})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(
+            len(payload["embedding"]), embeddings.EMBEDDING_DIMENSION
+        )
+
+    def test_embed_batch_endpoint_returns_embeddings(self) -> None:
+        response = self.http.post("/embed/batch", json={"texts": ["a", "b"]})
+
+        self.assertEqual(response.status_code, 200)
+        payload = response.json()
+        self.assertEqual(len(payload["embeddings"]), 2)
+        self.assertEqual(
+            len(payload["embeddings"][0]), embeddings.EMBEDDING_DIMENSION
+        )
+
+
+class MatchEndpointValidationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        from fastapi.testclient import TestClient
+
+        self.http = TestClient(main.app)
+
+    def test_openapi_schema_is_generable(self) -> None:
+        response = self.http.get("/openapi.json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("/match", response.json()["paths"])
+
+    def test_null_graduate_embedding_is_rejected(self) -> None:
+        response = self.http.post(
+            "/match",
+            json={"graduate_embedding": None, "job_embeddings": []},
+        )
+
+        self.assertEqual(response.status_code, 422)
+
+    def test_scalar_graduate_embedding_is_rejected(self) -> None:
+        response = self.http.post(
+            "/match",
+            json={"graduate_embedding": 0.5, "job_embeddings": []},
+        )
+
+        self.assertEqual(response.status_code, 422)
+
+
 class FeedbackTests(unittest.TestCase):
     def setUp(self) -> None:
         self.feedback_patch = patch("app.feedback._call_openai", new_callable=AsyncMock)
@@ -171,6 +255,7 @@ class QuestionGenerationTests(unittest.TestCase):
     def setUp(self) -> None:
         self.questions_patch = patch("app.questions._call_openai", new_callable=AsyncMock)
         self.mock_call = self.questions_patch.start()
+        questions._question_cache.clear()  # type: ignore[attr-defined]
 
     def tearDown(self) -> None:
         self.questions_patch.stop()
@@ -196,6 +281,74 @@ class QuestionGenerationTests(unittest.TestCase):
         self.assertEqual(len(questions_result), 1)
         self.assertEqual(questions_result[0]["skill"], "React")
 
+    def test_repeated_question_requests_are_cached(self) -> None:
+        payload = {
+            "questions": [
+                {
+                    "question": "What does useMemo do?",
+                    "options": ["Memoises a value", "Renders a component"],
+                    "answer": "Memoises a value",
+                    "skill": "React",
+                }
+            ]
+        }
+        self.mock_call.return_value = json.dumps(payload)
+
+        first = asyncio.run(
+            questions.generate_assessment_questions(["React"], num_questions=1)
+        )
+        second = asyncio.run(
+            questions.generate_assessment_questions([" react "], num_questions=1)
+        )
+
+        self.assertEqual(first, second)
+        self.mock_call.assert_awaited_once()
+
+    def test_generate_assessment_questions_stream_yields_incrementally(self) -> None:
+        payload = json.dumps(
+            {
+                "questions": [
+                    {
+                        "question": "What is JSX?",
+                        "options": ["A syntax extension", "A database"],
+                        "answer": "A syntax extension",
+                        "skill": "React",
+                    },
+                    {
+                        "question": "What does useState return?",
+                        "options": ["A tuple of value and setter", "A class"],
+                        "answer": "A tuple of value and setter",
+                        "skill": "React",
+                    },
+                ]
+            }
+        )
+
+        async def fake_stream(**kwargs):
+            async def chunks():
+                for start in range(0, len(payload), 7):
+                    delta = types.SimpleNamespace(content=payload[start : start + 7])
+                    yield types.SimpleNamespace(
+                        choices=[types.SimpleNamespace(delta=delta)]
+                    )
+
+            return chunks()
+
+        async def collect():
+            received = []
+            with patch.object(
+                questions.client.chat.completions, "create", new=fake_stream
+            ):
+                async for question in questions.generate_assessment_questions_stream(
+                    ["React"], num_questions=2
+                ):
+                    received.append(question)
+            return received
+
+        streamed = asyncio.run(collect())
+        self.assertEqual(len(streamed), 2)
+        self.assertEqual(streamed[0]["skill"], "React")
+
     def test_generate_assessment_questions_requires_skills(self) -> None:
         with self.assertRaises(questions.QuestionGenerationError):
             asyncio.run(questions.generate_assessment_questions([]))